@@ -1,161 +1,246 @@
 import sys
-from itertools import combinations
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import cached_property, lru_cache
+from pathlib import Path
+from types import SimpleNamespace
 
-def decimal_to_binary(num, num_vars):
-    """Convert decimal number to binary string of specified length."""
-    return format(num, f'0{num_vars}b')
+# Largest number of input variables supported
+MAX_VARS = 20
 
-def count_ones(binary_str):
-    """Count number of '1's in binary string."""
-    return binary_str.count('1')
+# Variable names by bit position, plain and complemented, for
+# expressions and Verilog
+VAR_UPPER = [chr(ord('A') + i) for i in range(MAX_VARS)]
+VAR_LOWER = [chr(ord('a') + i) for i in range(MAX_VARS)]
+VAR_PRIMED = [name + "'" for name in VAR_UPPER]
+VAR_NEGATED = [f"~{name}" for name in VAR_LOWER]
 
-def can_combine(term1, term2):
-    """Check if two terms differ by exactly one bit."""
-    if len(term1) != len(term2):
-        return False
-    
-    diff_count = 0
-    for i in range(len(term1)):
-        if term1[i] != term2[i]:
-            if term1[i] == '-' or term2[i] == '-':
-                return False
-            diff_count += 1
-    
-    return diff_count == 1
+def indices_to_bits(indices):
+    """Convert minterm or PI indices to a bitset with bit i set for index i."""
+    # Set the bits in a byte sieve and convert once; or-ing into an int
+    # would copy the whole bitset for every index
+    sieve = bytearray()
+    for i in indices:
+        byte = i >> 3
+        if byte >= len(sieve):
+            sieve.extend(bytes(byte + 1 - len(sieve)))
+        sieve[byte] |= 1 << (i & 7)
+    return int.from_bytes(sieve, 'little')
 
-def combine_terms(term1, term2, minterms1, minterms2):
-    """Combine two terms that differ by one bit."""
-    new_binary = ""
-    for i in range(len(term1)):
-        if term1[i] == term2[i]:
-            new_binary += term1[i]
+def bits_to_indices(bits):
+    """Convert a bitset to the list of its set bit indices in ascending order."""
+    # Scan the binary digits, lowest bit first, instead of clearing bits
+    # one at a time, which copies the whole bitset for every index
+    digits = bin(bits)[:1:-1]
+    indices = []
+    i = digits.find('1')
+    while i != -1:
+        indices.append(i)
+        i = digits.find('1', i + 1)
+    return indices
+
+def term_to_string(value, mask, num_vars):
+    """Convert (value, mask) term to binary string with '-' for masked bits."""
+    chars = []
+    for i in range(num_vars - 1, -1, -1):
+        if (mask >> i) & 1:
+            chars.append('-')
         else:
-            new_binary += '-'
+            chars.append('1' if (value >> i) & 1 else '0')
+    return ''.join(chars)
+
+def term_minterms(value, mask):
+    """List the minterms covered by a (value, mask) term in ascending order."""
+    minterms = []
+    sub = 0
+    while True:
+        minterms.append(value | sub)
+        if sub == mask:
+            return minterms
+        sub = (sub - mask) & mask  # Next subset of the mask bits
+
+def covered_minterms(value, mask, minterm_set):
+    """List the members of minterm_set covered by a (value, mask) term."""
+    # Walk whichever is smaller, the term itself or the minterm set
+    if 1 << mask.bit_count() <= len(minterm_set):
+        return [m for m in term_minterms(value, mask) if m in minterm_set]
+    return [m for m in minterm_set if m & ~mask == value]
+
+def count_ones(value, mask):
+    """Count number of 1 bits in the fixed positions of a term."""
+    return (value & ~mask).bit_count()
+
+def combine_terms(value1, mask1, value2, mask2):
+    """Combine two terms that differ by one bit."""
+    diff = value1 ^ value2
+    return value1 & ~diff, mask1 | diff
+
+def combine_pass(current_terms, full_mask):
+    """Run one combining pass over the terms of a single QM column.
     
-    new_minterms = minterms1.union(minterms2)
-    return new_binary, new_minterms
+    current_terms must be sorted by their ones count. Returns the combined
+    terms for the next column, again sorted by ones, and the set of
+    (value, mask) keys of the terms that took part in a combination.
+    """
+    # Find the (ones, start, end) run of each group in the sorted terms
+    groups = []
+    start = 0
+    for idx in range(1, len(current_terms) + 1):
+        if idx == len(current_terms) or current_terms[idx][2] != current_terms[start][2]:
+            groups.append((current_terms[start][2], start, idx))
+            start = idx
+    
+    next_terms = []
+    seen_terms = set()
+    used_terms = set()  # Track which (value, mask) terms were combined
+    
+    # Combine terms between adjacent groups
+    for lower, upper in zip(groups, groups[1:]):
+        ones, lower_start, lower_end = lower
+        upper_ones, upper_start, upper_end = upper
+        if upper_ones == ones + 1:
+            # Index the upper group by mask, then value, so that partners of
+            # a term are found by lookup instead of testing every pair
+            upper_index = {}
+            for idx in range(upper_start, upper_end):
+                val2, mask2, ones2 = current_terms[idx]
+                if mask2 not in upper_index:
+                    upper_index[mask2] = {}
+                upper_index[mask2].setdefault(val2, idx)
+            
+            for lower_idx in range(lower_start, lower_end):
+                val1, mask1, ones1 = current_terms[lower_idx]
+                same_mask = upper_index.get(mask1)
+                if same_mask is None:
+                    continue
+                
+                # A partner has the same mask and one more fixed 1 bit
+                partners = []
+                free_bits = full_mask & ~(val1 | mask1)
+                while free_bits:
+                    bit = free_bits & -free_bits
+                    idx = same_mask.get(val1 | bit)
+                    if idx is not None:
+                        partners.append(idx)
+                    free_bits ^= bit
+                
+                for idx in sorted(partners):
+                    val2, mask2, ones2 = current_terms[idx]
+                    
+                    # Mark both terms as used
+                    used_terms.add((val1, mask1))
+                    used_terms.add((val2, mask2))
+                    
+                    # Combine; the merged term keeps the lower term's ones
+                    new_val, new_mask = combine_terms(val1, mask1, val2, mask2)
+                    
+                    if (new_val, new_mask) not in seen_terms:
+                        next_terms.append((new_val, new_mask, ones1))
+                        seen_terms.add((new_val, new_mask))
+    
+    return next_terms, used_terms
 
 def generate_prime_implicants(minterms, dont_cares, num_vars):
-    """Generate all prime implicants using Quine-McCluskey algorithm."""
+    """Generate all prime implicants using Quine-McCluskey algorithm.
+    
+    Each prime implicant is a (value, mask) tuple; it covers value | sub
+    for every subset sub of the mask bits.
+    """
     # Combine minterms and don't cares
     all_terms = minterms + dont_cares
+    full_mask = (1 << num_vars) - 1
     
-    # Create initial terms: (binary_string, set_of_minterms)
+    # Create initial terms: (value, mask, ones)
+    # mask has a 1 for every eliminated ('-') bit position
     current_terms = []
     for term in all_terms:
-        binary = decimal_to_binary(term, num_vars)
-        current_terms.append((binary, {term}))
+        current_terms.append((term, 0, count_ones(term, 0)))
+    
+    # Sort by ones once; every later column comes out of combine_pass sorted
+    current_terms.sort(key=lambda x: x[2])
     
     prime_implicants = []
+    pi_keys = set()  # (value, mask) keys already in prime_implicants
     
     # Iteratively combine terms
     while current_terms:
-        # Group by number of ones
-        groups = {}
-        for binary, mins in current_terms:
-            ones = count_ones(binary)
-            if ones not in groups:
-                groups[ones] = []
-            groups[ones].append((binary, mins))
-        
-        next_terms = []
-        seen_binaries = set()
-        used_terms = set()  # Track which binary strings were combined
-        
-        # Combine terms between adjacent groups
-        sorted_ones = sorted(groups.keys())
-        for ones in sorted_ones:
-            if ones + 1 in groups:
-                for bin1, mins1 in groups[ones]:
-                    for bin2, mins2 in groups[ones + 1]:
-                        if can_combine(bin1, bin2):
-                            # Mark both terms as used
-                            used_terms.add(bin1)
-                            used_terms.add(bin2)
-                            
-                            # Combine
-                            new_bin, new_mins = combine_terms(bin1, bin2, mins1, mins2)
-                            
-                            if new_bin not in seen_binaries:
-                                next_terms.append((new_bin, new_mins))
-                                seen_binaries.add(new_bin)
+        next_terms, used_terms = combine_pass(current_terms, full_mask)
         
         # Add unused terms to prime implicants
-        for binary, mins in current_terms:
-            if binary not in used_terms:
-                # Check if already in prime implicants
-                already_exists = False
-                for pi_binary, pi_mins in prime_implicants:
-                    if pi_binary == binary:
-                        already_exists = True
-                        break
-                
-                if not already_exists:
-                    prime_implicants.append((binary, mins))
+        for value, mask, ones in current_terms:
+            key = (value, mask)
+            if key not in used_terms and key not in pi_keys:
+                pi_keys.add(key)
+                prime_implicants.append(key)
         
         current_terms = next_terms
     
-    # Sort by first minterm for consistent output
-    prime_implicants.sort(key=lambda x: min(x[1]))
+    # Sort by first minterm, which is the value, for consistent output
+    prime_implicants.sort(key=lambda x: x[0])
     
     return prime_implicants
 
 def build_pi_chart(prime_implicants, minterms):
-    """Build prime implicant chart mapping minterms to PI indices."""
-    pi_chart = {m: [] for m in minterms}
+    """Build prime implicant chart mapping minterms to a bitset of PI indices."""
+    pi_indices = {m: [] for m in minterms}
     
-    for idx, (binary, mins) in enumerate(prime_implicants):
-        for m in mins:
-            if m in minterms:
-                pi_chart[m].append(idx)
+    for idx, (value, mask) in enumerate(prime_implicants):
+        for m in covered_minterms(value, mask, pi_indices):
+            pi_indices[m].append(idx)
     
-    return pi_chart
+    # Convert each list once; or-ing PI bits in one at a time would copy
+    # the growing bitset for every PI
+    return {m: indices_to_bits(indices) for m, indices in pi_indices.items()}
 
 def find_essential_pis(prime_implicants, pi_chart):
     """Find essential prime implicants."""
     essential_indices = set()
     
     for minterm, pi_indices in pi_chart.items():
-        if len(pi_indices) == 1:
-            essential_indices.add(pi_indices[0])
+        if pi_indices.bit_count() == 1:
+            essential_indices.add(pi_indices.bit_length() - 1)
     
     essential_pis = [prime_implicants[idx] for idx in sorted(essential_indices)]
     return essential_pis, essential_indices
 
 def get_uncovered_minterms(essential_pis, minterms):
-    """Find minterms not covered by essential PIs."""
-    covered = set()
-    for binary, mins in essential_pis:
-        for m in mins:
-            if m in minterms:
-                covered.add(m)
-    
-    uncovered = set(minterms) - covered
-    return uncovered
+    """Find minterms not covered by essential PIs, as a sorted list."""
+    uncovered = set(minterms)
+    for value, mask in essential_pis:
+        uncovered.difference_update(covered_minterms(value, mask, uncovered))
+    
+    return sorted(uncovered)
 
-def term_to_expression(binary, num_vars):
-    """Convert binary term to Boolean expression."""
-    var_names = [chr(ord('A') + i) for i in range(num_vars)]
-    expr = ""
-    
-    for i in range(len(binary)):
-        if binary[i] == '1':
-            expr += var_names[i]
-        elif binary[i] == '0':
-            expr += var_names[i] + "'"
-    
-    return expr if expr else "1"
+@lru_cache(maxsize=4096)
+def term_to_expression(value, mask, num_vars):
+    """Convert (value, mask) term to Boolean expression."""
+    parts = []
+    
+    for i in range(num_vars):
+        bit = 1 << (num_vars - 1 - i)
+        if mask & bit:
+            continue
+        if value & bit:
+            parts.append(VAR_UPPER[i])
+        else:
+            parts.append(VAR_PRIMED[i])
+    
+    return "".join(parts) if parts else "1"
 
-def term_to_verilog(binary, num_vars):
-    """Convert binary term to Verilog expression."""
-    var_names = [chr(ord('a') + i) for i in range(num_vars)]
+@lru_cache(maxsize=4096)
+def term_to_verilog(value, mask, num_vars):
+    """Convert (value, mask) term to Verilog expression."""
     parts = []
     
-    for i in range(len(binary)):
-        if binary[i] == '1':
-            parts.append(var_names[i])
-        elif binary[i] == '0':
-            parts.append(f"~{var_names[i]}")
+    for i in range(num_vars):
+        bit = 1 << (num_vars - 1 - i)
+        if mask & bit:
+            continue
+        if value & bit:
+            parts.append(VAR_LOWER[i])
+        else:
+            parts.append(VAR_NEGATED[i])
     
     if not parts:
         return "1'b1"
@@ -163,7 +248,7 @@ def term_to_verilog(binary, num_vars):
 
 def generate_verilog(prime_implicants, essential_pis, solutions, num_vars, testcase_num):
     """Generate Verilog module for the minimized expression."""
-    var_names = [chr(ord('a') + i) for i in range(num_vars)]
+    var_names = VAR_LOWER[:num_vars]
     
     # Use first solution
     if not solutions:
@@ -171,141 +256,307 @@ def generate_verilog(prime_implicants, essential_pis, solutions, num_vars, testc
     else:
         solution = solutions[0]
     
-    verilog_code = f"module boolean_function_{testcase_num} (\n"
-    verilog_code += f"    input {', '.join(var_names)},\n"
-    verilog_code += f"    output x\n"
-    verilog_code += f");\n\n"
+    parts = [
+        f"module boolean_function_{testcase_num} (\n",
+        f"    input {', '.join(var_names)},\n",
+        "    output x\n",
+        ");\n\n",
+    ]
     
     # Collect all terms
     terms = []
     
     # Add essential PIs
-    for binary, mins in essential_pis:
-        terms.append(term_to_verilog(binary, num_vars))
+    for value, mask in essential_pis:
+        terms.append(term_to_verilog(value, mask, num_vars))
     
     # Add selected PIs
     for pi_idx in solution:
-        binary, mins = prime_implicants[pi_idx]
-        terms.append(term_to_verilog(binary, num_vars))
+        value, mask = prime_implicants[pi_idx]
+        terms.append(term_to_verilog(value, mask, num_vars))
     
     if not terms:
-        verilog_code += f"    assign x = 1'b0;\n"
+        parts.append("    assign x = 1'b0;\n")
     else:
-        verilog_code += f"    assign x = "
-        verilog_code += " |\n                   ".join(f"({term})" for term in terms)
-        verilog_code += ";\n"
+        parts.append("    assign x = ")
+        parts.append(" |\n                   ".join(f"({term})" for term in terms))
+        parts.append(";\n")
     
-    verilog_code += f"\nendmodule\n"
+    parts.append("\nendmodule\n")
     
-    return verilog_code
+    return "".join(parts)
 
-def find_minimal_covers(prime_implicants, pi_chart, uncovered_minterms, 
-                        essential_indices, max_depth=15):
-    """Find all minimal covers for uncovered minterms using backtracking."""
-    if not uncovered_minterms:
-        return [[]]
-    
-    # Get non-essential PIs that cover uncovered minterms
-    covering_pis = {}
-    for m in uncovered_minterms:
-        covering_pis[m] = [idx for idx in pi_chart[m] if idx not in essential_indices]
-    
-    solutions = []
-    
-    def backtrack(current_solution, current_covered, depth):
-        nonlocal solutions
-        
+def branch_options(covering_pis, pi_bits, remaining, excluded,
+                   drop_dominated=False):
+    """Return (lower_bound, candidates) for one node of the cover search.
+    
+    lower_bound is the number of remaining minterms that pairwise share no
+    candidate PI, so each needs a PI of its own. candidates are the PIs
+    covering the most constrained minterm, largest coverage first. With
+    drop_dominated, a candidate covering no remaining minterm beyond an
+    earlier candidate is left out; some minimal cover is still reachable,
+    but not necessarily all of them.
+    Returns None if some remaining minterm has no candidate PI left.
+    """
+    # Candidate PIs of every remaining minterm, fewest first
+    options = []
+    for m in bits_to_indices(remaining):
+        m_candidates = covering_pis[m] & ~excluded
+        if not m_candidates:
+            return None  # This minterm can no longer be covered
+        options.append((m_candidates.bit_count(), m, m_candidates))
+    options.sort()
+    
+    # Lower bound: greedily pick minterms sharing no candidate PI with
+    # an earlier pick
+    lower_bound = 0
+    left = remaining
+    for count, m, m_candidates in options:
+        if (left >> m) & 1:
+            lower_bound += 1
+            for idx in bits_to_indices(m_candidates):
+                left &= ~pi_bits[idx]
+    
+    # Branch on the minterm with the fewest candidates, trying the PIs
+    # that cover the most remaining minterms first
+    candidates = sorted(bits_to_indices(options[0][2]),
+                        key=lambda idx: -(pi_bits[idx] & remaining).bit_count())
+    
+    if drop_dominated:
+        kept = []
+        kept_covers = []
+        for idx in candidates:
+            cover = pi_bits[idx] & remaining
+            if not any(cover & other == cover for other in kept_covers):
+                kept.append(idx)
+                kept_covers.append(cover)
+        candidates = kept
+    
+    return lower_bound, candidates
+
+def search_covers(covering_pis, pi_bits, uncovered_minterms, solution, covered,
+                  excluded, max_depth, best_len, find_all=True, lock=None):
+    """Backtrack from one node of the cover search tree.
+    
+    best_len.value holds the size of the smallest cover found so far by
+    any search, and is used for pruning. When best_len is shared between
+    processes, lock guards updates to it. Returns the smallest covers
+    found below this node. Without find_all only one smallest cover is
+    looked for, so ties and dominated PIs are pruned as well; this is
+    used to tighten best_len quickly.
+    """
+    if lock is None:
+        lock = nullcontext()
+    leaves = []  # (size, path) of the smallest covers found
+    memo = {}  # covered bitset -> fewest PIs seen reaching it
+    
+    # The chosen PIs form a linked list of (pi_idx, parent) nodes, so a
+    # branch extends its parent's path without copying it
+    def backtrack(path, current_covered, excluded, depth):
         # All covered - found a solution
-        if len(current_covered) == len(uncovered_minterms):
-            if not solutions or len(current_solution) <= len(solutions[0]):
-                if solutions and len(current_solution) < len(solutions[0]):
-                    solutions.clear()
-                solutions.append(current_solution[:])
+        if current_covered == uncovered_minterms:
+            if depth < best_len.value or (find_all and depth == best_len.value):
+                if depth < best_len.value:
+                    with lock:
+                        best_len.value = min(best_len.value, depth)
+                if leaves and depth < leaves[0][0]:
+                    leaves.clear()
+                leaves.append((depth, path))
             return
         
         # Pruning
-        if solutions and len(current_solution) >= len(solutions[0]):
+        if depth >= best_len.value:
             return
         
         if depth > max_depth:
             return
         
-        # Find an uncovered minterm
-        uncovered = None
-        for m in uncovered_minterms:
-            if m not in current_covered:
-                uncovered = m
-                break
+        # Skip states already reached with fewer PIs; ties are still
+        # explored so that every minimal cover is found
+        prev = memo.get(current_covered)
+        if prev is not None and prev < depth:
+            return
+        memo[current_covered] = depth
         
-        if uncovered is None:
+        remaining = uncovered_minterms & ~current_covered
+        options = branch_options(covering_pis, pi_bits, remaining, excluded,
+                                 drop_dominated=not find_all)
+        if options is None:
             return
         
-        # Try each PI that covers this minterm
-        for pi_idx in covering_pis[uncovered]:
-            if pi_idx in current_solution:
-                continue
-            
-            # Add this PI
-            current_solution.append(pi_idx)
-            new_covered = current_covered.copy()
-            
-            for m in prime_implicants[pi_idx][1]:
-                if m in uncovered_minterms:
-                    new_covered.add(m)
-            
-            backtrack(current_solution, new_covered, depth + 1)
-            current_solution.pop()
+        lower_bound, candidates = options
+        if depth + lower_bound > best_len.value:
+            return
+        if not find_all and depth + lower_bound == best_len.value:
+            return
+        
+        # Try each PI that covers this minterm. Once a PI's branch is done
+        # it is excluded from the later branches, so every cover is
+        # generated once rather than once per ordering of its PIs.
+        for pi_idx in candidates:
+            new_covered = current_covered | pi_bits[pi_idx]
+            backtrack((pi_idx, path), new_covered, excluded, depth + 1)
+            excluded |= 1 << pi_idx
+    
+    path = None
+    for pi_idx in solution:
+        path = (pi_idx, path)
+    backtrack(path, covered, excluded, len(solution))
+    
+    # Materialize the paths of the covers found
+    solutions = []
+    for size, path in leaves:
+        cover = []
+        while path is not None:
+            pi_idx, path = path
+            cover.append(pi_idx)
+        cover.reverse()
+        solutions.append(cover)
+    return solutions
+
+def init_cover_worker(best_len):
+    """Store the shared best cover size in a cover search worker process."""
+    global shared_best_len
+    shared_best_len = best_len
+
+def search_covers_worker(covering_pis, pi_bits, uncovered_minterms, solution,
+                         covered, excluded, max_depth):
+    """Run search_covers in a worker process against the shared bound."""
+    # Read the shared value without locking; only updates take the lock
+    return search_covers(covering_pis, pi_bits, uncovered_minterms, solution,
+                         covered, excluded, max_depth,
+                         shared_best_len.get_obj(),
+                         lock=shared_best_len.get_lock())
+
+def reduce_columns(covering_pis, minterms):
+    """Drop minterms whose candidate PIs include those of another minterm.
+    
+    Any PI set covering the kept minterm covers the dropped one too, so
+    the reduced bitset has exactly the same covers as the original.
+    """
+    reduced = 0
+    kept = []  # Candidate bitsets of kept minterms, fewest candidates first
+    for m in sorted(bits_to_indices(minterms),
+                    key=lambda m: covering_pis[m].bit_count()):
+        candidates = covering_pis[m]
+        if any(other & candidates == other for other in kept):
+            continue
+        kept.append(candidates)
+        reduced |= 1 << m
+    return reduced
+
+def find_minimal_covers(prime_implicants, pi_chart, uncovered_minterms, 
+                        essential_indices, max_depth=15, workers=1):
+    """Find all minimal covers for uncovered minterms using backtracking.
+    
+    With workers > 1 the search is split at the root and the branches are
+    explored in parallel by up to that many processes, sharing the best
+    cover size found so far for pruning.
+    """
+    if not uncovered_minterms:
+        return [[]]
     
-    backtrack([], set(), 0)
+    # Get non-essential PIs that cover uncovered minterms, as PI bitsets.
+    # The search indexes minterms by their position in uncovered_minterms,
+    # so its bitsets are only as wide as the cover problem.
+    essential_mask = indices_to_bits(essential_indices)
+    covering_pis = [pi_chart[m] & ~essential_mask for m in uncovered_minterms]
+    
+    # Only minterms not dominated by another need to be covered explicitly
+    target = reduce_columns(covering_pis,
+                            indices_to_bits(range(len(uncovered_minterms))))
+    pi_positions = {}  # PI index -> positions of target minterms it covers
+    for pos in bits_to_indices(target):
+        for idx in bits_to_indices(covering_pis[pos]):
+            pi_positions.setdefault(idx, []).append(pos)
+    pi_bits = {idx: indices_to_bits(positions)
+               for idx, positions in pi_positions.items()}
+    
+    # No cover can be longer than max_depth + 1 PIs
+    best_len = SimpleNamespace(value=max_depth + 2)
+    
+    # Find one minimal cover first with dominated PIs and ties pruned, so
+    # that enumerating all minimal covers starts from a tight bound
+    search_covers(covering_pis, pi_bits, target, [], 0, 0, max_depth,
+                  best_len, find_all=False)
+    
+    options = branch_options(covering_pis, pi_bits, target, 0)
+    if workers <= 1 or options is None or len(options[1]) < 2:
+        solutions = search_covers(covering_pis, pi_bits, target, [], 0, 0,
+                                  max_depth, best_len)
+    else:
+        # One task per PI of the root branch, each excluding the PIs of
+        # the branches before it
+        tasks = []
+        excluded = 0
+        for pi_idx in options[1]:
+            tasks.append(([pi_idx], pi_bits[pi_idx], excluded))
+            excluded |= 1 << pi_idx
+        
+        # Share the bound found so far with the workers
+        shared_len = multiprocessing.Value('i', best_len.value)
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks)),
+                                 initializer=init_cover_worker,
+                                 initargs=(shared_len,)) as pool:
+            futures = [pool.submit(search_covers_worker, covering_pis, pi_bits,
+                                   target, solution, covered,
+                                   excluded, max_depth)
+                       for solution, covered, excluded in tasks]
+            solutions = [sol for future in futures for sol in future.result()]
+    
+    # Keep only the smallest covers found by any search
+    if solutions:
+        size = min(len(sol) for sol in solutions)
+        solutions = [sol for sol in solutions if len(sol) == size]
     return solutions
 
 def print_results(prime_implicants, essential_pis, essential_indices, 
                  uncovered_minterms, solutions, num_vars):
     """Print all results."""
     print("\n=== PRIME IMPLICANTS ===")
-    for idx, (binary, mins) in enumerate(prime_implicants):
-        minterms_str = ", ".join(map(str, sorted(mins)))
-        expr = term_to_expression(binary, num_vars)
+    for idx, (value, mask) in enumerate(prime_implicants):
+        binary = term_to_string(value, mask, num_vars)
+        minterms_str = ", ".join(map(str, term_minterms(value, mask)))
+        expr = term_to_expression(value, mask, num_vars)
         print(f"PI{idx + 1}: {binary} | Covers minterms: {minterms_str} | Expression: {expr}")
     
     print("\n=== ESSENTIAL PRIME IMPLICANTS ===")
     if not essential_pis:
         print("None")
     else:
-        for binary, mins in essential_pis:
-            print(term_to_expression(binary, num_vars))
+        for value, mask in essential_pis:
+            print(term_to_expression(value, mask, num_vars))
     
     print("\n=== UNCOVERED MINTERMS ===")
     if not uncovered_minterms:
         print("None (all minterms covered by essential PIs)")
     else:
-        print(", ".join(map(str, sorted(uncovered_minterms))))
+        print(", ".join(map(str, uncovered_minterms)))
     
     print("\n=== MINIMIZED BOOLEAN EXPRESSION(S) ===")
+    # Essential PIs are shared by every solution
+    essential_terms = [term_to_expression(value, mask, num_vars)
+                       for value, mask in essential_pis]
+    
     for sol_idx, solution in enumerate(solutions):
-        print(f"Solution {sol_idx + 1}: F = ", end="")
-        
-        terms = []
-        
-        # Add essential PIs
-        for binary, mins in essential_pis:
-            terms.append(term_to_expression(binary, num_vars))
+        terms = essential_terms[:]
         
         # Add selected PIs
         for pi_idx in solution:
-            binary, mins = prime_implicants[pi_idx]
-            terms.append(term_to_expression(binary, num_vars))
+            value, mask = prime_implicants[pi_idx]
+            terms.append(term_to_expression(value, mask, num_vars))
         
-        if not terms:
-            print("0")
-        else:
-            print(" + ".join(terms))
+        expr = " + ".join(terms) if terms else "0"
+        print(f"Solution {sol_idx + 1}: F = {expr}")
 
 def parse_input_file(filename):
     """Parse input file and return num_vars, minterms, and don't cares."""
     try:
-        with open(filename, 'r') as f:
-            lines = [line.strip() for line in f.readlines()]
+        # Only the first three lines are used, so stop splitting there
+        lines = Path(filename).read_text().split('\n', 3)
+        if lines[-1] == '':
+            lines.pop()  # Trailing newline does not start another line
+        lines = [line.strip() for line in lines[:3]]
         
         if len(lines) < 2:
             print("Error: File must have at least 2 lines")
@@ -313,8 +564,8 @@ def parse_input_file(filename):
         
         # Read number of variables
         num_vars = int(lines[0])
-        if num_vars < 1 or num_vars > 20:
-            print("Error: Number of variables must be between 1 and 20")
+        if num_vars < 1 or num_vars > MAX_VARS:
+            print(f"Error: Number of variables must be between 1 and {MAX_VARS}")
             return None, None, None
         
         # Read minterms or maxterms
@@ -411,6 +662,44 @@ def parse_testcase_input(input_str):
     
     return unique_testcases
 
+class QMSolver:
+    """Quine-McCluskey pipeline for one function, computing each stage once.
+    
+    Each stage is a cached property built from the previous ones, so
+    reading solutions runs the whole pipeline and later reads are free.
+    """
+    
+    def __init__(self, minterms, dont_cares, num_vars):
+        self.minterms = minterms
+        self.dont_cares = dont_cares
+        self.num_vars = num_vars
+    
+    @cached_property
+    def prime_implicants(self):
+        """List of (value, mask) prime implicants."""
+        return generate_prime_implicants(self.minterms, self.dont_cares, self.num_vars)
+    
+    @cached_property
+    def pi_chart(self):
+        """Map of minterm to bitset of covering PI indices."""
+        return build_pi_chart(self.prime_implicants, self.minterms)
+    
+    @cached_property
+    def essentials(self):
+        """Tuple of (essential_pis, essential_indices)."""
+        return find_essential_pis(self.prime_implicants, self.pi_chart)
+    
+    @cached_property
+    def uncovered_minterms(self):
+        """Sorted list of minterms not covered by essential PIs."""
+        return get_uncovered_minterms(self.essentials[0], self.minterms)
+    
+    @cached_property
+    def solutions(self):
+        """All minimal covers of the uncovered minterms, as PI index lists."""
+        return find_minimal_covers(self.prime_implicants, self.pi_chart,
+                                   self.uncovered_minterms, self.essentials[1])
+
 def process_testcase(testcase_num):
     """Process a single test case."""
     filename = f"./complex_test_cases/test{testcase_num}.txt"
@@ -427,24 +716,12 @@ def process_testcase(testcase_num):
     print(f"Minterms: {', '.join(map(str, minterms))}")
     print(f"Don't cares: {', '.join(map(str, dont_cares)) if dont_cares else 'None'}")
     
-    # Generate prime implicants
-    prime_implicants = generate_prime_implicants(minterms, dont_cares, num_vars)
-    
-    # Build PI chart
-    pi_chart = build_pi_chart(prime_implicants, minterms)
-    
-    # Find essential PIs
-    essential_pis, essential_indices = find_essential_pis(prime_implicants, pi_chart)
-    
-    # Find uncovered minterms
-    uncovered_minterms = get_uncovered_minterms(essential_pis, minterms)
-    
-    # Find minimal covers
-    solutions = find_minimal_covers(prime_implicants, pi_chart, uncovered_minterms, 
-                                   essential_indices)
-    
-    if not solutions and not uncovered_minterms:
-        solutions = [[]]
+    # Run the QM pipeline
+    solver = QMSolver(minterms, dont_cares, num_vars)
+    prime_implicants = solver.prime_implicants
+    essential_pis, essential_indices = solver.essentials
+    uncovered_minterms = solver.uncovered_minterms
+    solutions = solver.solutions
     
     # Print results
     print_results(prime_implicants, essential_pis, essential_indices, 
@@ -514,4 +791,4 @@ def main():
     return 0 if not failed_cases else 1
 
 if __name__ == "__main__":
-    exit(main())
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file